@@ -6,14 +6,99 @@ This module handles loading and managing configuration from config files.
 """
 
 import configparser
+import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any, Tuple
+
+
+# Default config file as ready-to-write INI text, so creating defaults is
+# a single write plus read_string instead of building parser state twice
+_DEFAULT_SETTINGS_INI = """\
+[ai]
+model = gemini-1.5-flash
+response_cache_size = 50
+response_cache_ttl_days = 30
+
+[paths]
+templates_dir = templates
+output_dir = output
+job_descriptions_dir = job_descriptions
+
+[files]
+resume_template = resume.tex
+resume_class = resume.cls
+
+[output]
+max_job_title_length = 50
+include_timestamp = true
+cleanup_aux_files = true
+pdf_cache_dir = .pdfcache
+pdf_cache_size = 20
+
+[latex]
+compiler = pdflatex
+compilation_passes = 2
+compiler_options = -interaction=batchmode -halt-on-error
+compile_timeout = 120
+draftmode_first_pass = true
+aux_extensions = .aux,.log,.out,.fdb_latexmk,.fls,.synctex.gz
+
+[customization]
+focus_areas = skills,experience,summary,keywords
+add_explanations = false
+preserve_formatting = true
+max_retries = 3
+"""
+
+# Prompt settings live in the same file, under namespaced [prompt.*]
+# sections, so a load parses one file instead of two
+_DEFAULT_PROMPT_SECTIONS_INI = """\
+[prompt.system]
+role = You are a professional resume optimization expert with expertise in tailoring resumes for specific job applications.
+
+[prompt.instructions]
+context = I'm providing you with my current resume in LaTeX format and a job description for a position I'm applying to. Please customize my resume to better match the job requirements while keeping the same LaTeX structure and formatting.
+
+[prompt.customization]
+focus_areas = technical skills, project experience, leadership qualities, relevant certifications
+add_explanations = true
+preserve_formatting = true
+
+[prompt.output]
+format_requirements = Please return ONLY the complete customized LaTeX resume content. Do not include any explanations, markdown formatting, or additional text outside the LaTeX code.
+quality_guidelines = Ensure all LaTeX syntax is correct and the document will compile properly.
+
+[prompt.style]
+approach = Maintain the professional tone and structure of the original resume while emphasizing the most relevant qualifications for the target position.
+"""
+
+_DEFAULT_CONFIG_INI = _DEFAULT_SETTINGS_INI + "\n" + _DEFAULT_PROMPT_SECTIONS_INI
 
 
 class ConfigManager:
     """Manages configuration settings for the Resume Customizer Tool."""
-    
+
+    # Slots keep attribute access a fixed-offset load instead of a dict
+    # lookup; the materialized getters read these on every call
+    __slots__ = (
+        'config_dir', 'config_file', 'prompts_file', 'cache_file',
+        'config',
+        '_defer_writes', '_dirty_config', '_loaded_mtime',
+        '_ai_model', '_response_cache_size', '_response_cache_ttl_days',
+        '_templates_dir', '_output_dir', '_job_descriptions_dir',
+        '_templates_dir_str', '_output_dir_str',
+        '_resume_template', '_resume_class', '_max_job_title_length',
+        '_include_timestamp', '_cleanup_aux_files', '_pdf_cache_dir',
+        '_pdf_cache_size', '_latex_compiler',
+        '_compilation_passes', '_compiler_options', '_compile_timeout',
+        '_draftmode_first_pass',
+        '_aux_extensions',
+        '_focus_areas', '_add_explanations', '_preserve_formatting',
+        '_max_retries', '_prompt_parts', '_prompt_cache', '_summary',
+    )
+
     def __init__(self, config_dir: Path = None):
         """Initialize the configuration manager."""
         if config_dir is None:
@@ -21,224 +106,422 @@ class ConfigManager:
         
         self.config_dir = config_dir
         self.config_file = config_dir / "config.ini"
+        # Legacy location of the prompt settings; folded into config.ini
+        # on first load when present
         self.prompts_file = config_dir / "prompts.ini"
-        
-        # Load configurations
-        self.config = configparser.ConfigParser()
-        self.prompts = configparser.ConfigParser()
-        
+        self.cache_file = config_dir / "config.cache.json"
+
+        # Load configurations. RawConfigParser skips %-interpolation on
+        # every get(); no config value here uses interpolation.
+        self.config = configparser.RawConfigParser()
+
+        # Batch-update state (see deferred_writes)
+        self._defer_writes = False
+        self._dirty_config = False
+
         self.load_configurations()
     
     def load_configurations(self):
-        """Load configuration files."""
-        # Load main config
-        if self.config_file.exists():
-            self.config.read(self.config_file)
-        else:
-            self._create_default_config()
-        
-        # Load prompts config
-        if self.prompts_file.exists():
-            self.prompts.read(self.prompts_file)
-        else:
-            self._create_default_prompts()
-    
-    def _create_default_config(self):
-        """Create default configuration if file doesn't exist."""
-        self.config['ai'] = {
-            'model': 'gemini-1.5-flash'
-        }
-        self.config['paths'] = {
-            'templates_dir': 'templates',
-            'output_dir': 'output',
-            'job_descriptions_dir': 'job_descriptions'
-        }
-        self.config['files'] = {
-            'resume_template': 'resume.tex',
-            'resume_class': 'resume.cls'
-        }
-        self.config['output'] = {
-            'max_job_title_length': '50',
-            'include_timestamp': 'true',
-            'cleanup_aux_files': 'true'
-        }
-        self.config['latex'] = {
-            'compiler': 'pdflatex',
-            'compilation_passes': '2',
-            'compiler_options': '-interaction=nonstopmode',
-            'aux_extensions': '.aux,.log,.out,.fdb_latexmk,.fls,.synctex.gz'
-        }
-        self.config['customization'] = {
-            'focus_areas': 'skills,experience,summary,keywords',
-            'add_explanations': 'false',
-            'preserve_formatting': 'true',
-            'max_retries': '3'
+        """Load the configuration file."""
+        if not self._load_fast():
+            # Load main config; a single open doubles as the existence
+            # check, saving the separate stat that exists() would cost
+            try:
+                with open(self.config_file, 'r', buffering=65536, encoding='utf-8') as f:
+                    self.config.read_file(f)
+            except FileNotFoundError:
+                self._create_default_config()
+
+            # Fold a legacy prompts.ini into config.ini once, so every
+            # later load parses a single file
+            if not any(section.startswith('prompt.') for section in self.config.sections()):
+                self._migrate_legacy_prompts()
+
+            # Refresh the JSON cache for future loads
+            self._write_cache()
+
+        # Extract all settings into plain attributes for fast access
+        self._materialize()
+
+        # Remember what was parsed so cached instances can detect staleness
+        self._loaded_mtime = self._config_mtime_ns()
+
+    def _load_fast(self) -> bool:
+        """Try to load the config from the JSON sidecar cache.
+
+        The ini file stays the user-editable source of truth; the cache
+        just stores its already-parsed sections so an unchanged file skips
+        configparser's line-by-line parsing. Returns True on a cache hit.
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        mtime = self._config_mtime_ns()
+        if mtime == 0 or data.get('mtime') != mtime or 'config' not in data:
+            return False
+
+        self.config.read_dict(data['config'])
+        return True
+
+    def _write_cache(self):
+        """Serialize the parsed config to the JSON sidecar cache."""
+        data = {
+            'mtime': self._config_mtime_ns(),
+            'config': {section: dict(self.config[section]) for section in self.config.sections()},
         }
-        
-        # Save default config
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
-    
-    def _create_default_prompts(self):
-        """Create default prompts if file doesn't exist."""
-        self.prompts['main_prompt'] = {
-            'system_role': 'You are an expert resume writer and career consultant.',
-            'instruction': 'Customize the resume to match job requirements while preserving LaTeX structure.'
+        tmp_file = self.cache_file.with_suffix('.json.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # The cache is purely an optimization; never fail the load
+            pass
+
+    def _materialize(self):
+        """Extract all settings into typed instance attributes.
+
+        Reading through configparser on every getter call is needlessly
+        expensive, so each value is read exactly once here and the getters
+        return the cached attributes directly.
+        """
+        self._ai_model = self.config.get('ai', 'model', fallback='gemini-1.5-flash')
+        self._response_cache_size = self.config.getint('ai', 'response_cache_size', fallback=50)
+        self._response_cache_ttl_days = self.config.getint('ai', 'response_cache_ttl_days', fallback=30)
+
+        # Resolve directory paths once; getters hand out the same Path
+        # objects (and get_config_summary their cached str forms) instead
+        # of re-joining per call
+        self._templates_dir = (self.config_dir / self.config.get('paths', 'templates_dir', fallback='templates')).resolve()
+        self._output_dir = (self.config_dir / self.config.get('paths', 'output_dir', fallback='output')).resolve()
+        self._job_descriptions_dir = (self.config_dir / self.config.get('paths', 'job_descriptions_dir', fallback='job_descriptions')).resolve()
+        self._templates_dir_str = str(self._templates_dir)
+        self._output_dir_str = str(self._output_dir)
+        self._resume_template = self.config.get('files', 'resume_template', fallback='resume.tex')
+        self._resume_class = self.config.get('files', 'resume_class', fallback='resume.cls')
+        self._max_job_title_length = self.config.getint('output', 'max_job_title_length', fallback=50)
+        self._include_timestamp = self.config.getboolean('output', 'include_timestamp', fallback=True)
+        self._cleanup_aux_files = self.config.getboolean('output', 'cleanup_aux_files', fallback=True)
+        self._pdf_cache_dir = self._output_dir / self.config.get('output', 'pdf_cache_dir', fallback='.pdfcache')
+        self._pdf_cache_size = self.config.getint('output', 'pdf_cache_size', fallback=20)
+        self._latex_compiler = self.config.get('latex', 'compiler', fallback='pdflatex')
+        self._compilation_passes = self.config.getint('latex', 'compilation_passes', fallback=2)
+
+        # Pre-split list values into tuples so the split/strip work happens once
+        options = self.config.get('latex', 'compiler_options', fallback='-interaction=batchmode -halt-on-error')
+        self._compiler_options = tuple(opt.strip() for opt in options.split() if opt.strip())
+        self._compile_timeout = self.config.getint('latex', 'compile_timeout', fallback=120)
+        self._draftmode_first_pass = self.config.getboolean('latex', 'draftmode_first_pass', fallback=True)
+        extensions = self.config.get('latex', 'aux_extensions', fallback='.aux,.log,.out')
+        self._aux_extensions = tuple(ext.strip() for ext in extensions.split(',') if ext.strip())
+        areas = self.config.get('customization', 'focus_areas', fallback='skills,experience,summary')
+        self._focus_areas = tuple(area.strip() for area in areas.split(',') if area.strip())
+
+        self._add_explanations = self.config.getboolean('customization', 'add_explanations', fallback=False)
+        self._preserve_formatting = self.config.getboolean('customization', 'preserve_formatting', fallback=True)
+        self._max_retries = self.config.getint('customization', 'max_retries', fallback=3)
+
+        # Precompile the AI prompt template so build_ai_prompt only has to
+        # substitute the two per-call values
+        self._prompt_parts = self._build_prompt_parts()
+
+        # Built prompts, keyed by input pair; cleared whenever the
+        # template changes
+        self._prompt_cache = {}
+
+        # Precompute the summary dict once per load
+        self._summary = {
+            'ai_model': self._ai_model,
+            'templates_dir': self._templates_dir_str,
+            'output_dir': self._output_dir_str,
+            'latex_compiler': self._latex_compiler,
+            'compilation_passes': self._compilation_passes,
+            'focus_areas': self._focus_areas,
+            'max_retries': self._max_retries,
+            'include_timestamp': self._include_timestamp,
+            'cleanup_aux_files': self._cleanup_aux_files,
+            'preserve_formatting': self._preserve_formatting,
+            'add_explanations': self._add_explanations,
         }
-        
-        # Save default prompts
-        with open(self.prompts_file, 'w') as f:
-            self.prompts.write(f)
+
+    def _build_prompt_parts(self) -> Tuple[str, str, str]:
+        """Compose the static parts of the AI prompt at load time.
+
+        The prompt is stored as the three segments surrounding the
+        resume and the job description, so build_ai_prompt is a single
+        ''.join with no placeholder substitution — prompt text can
+        contain braces (e.g. LaTeX snippets) without escaping.
+        """
+        role = self.config.get('prompt.system', 'role', fallback='You are an expert resume writer.')
+        context = self.config.get('prompt.instructions', 'context', fallback='Customize the resume for the job.')
+        focus_areas = self.config.get('prompt.customization', 'focus_areas', fallback='skills, experience')
+        format_req = self.config.get('prompt.output', 'format_requirements', fallback='Return only LaTeX code.')
+        quality = self.config.get('prompt.output', 'quality_guidelines', fallback='Ensure proper LaTeX syntax.')
+        approach = self.config.get('prompt.style', 'approach', fallback='Maintain professional tone.')
+
+        prefix = f"""{role}
+
+{context}
+
+Focus on: {focus_areas}
+
+IMPORTANT REQUIREMENTS:
+- {format_req}
+- {quality}
+- {approach}
+
+OUTPUT FORMAT:
+Please return ONLY the complete customized LaTeX resume content. Do not include any explanations, markdown formatting, or additional text outside the LaTeX code.
+
+Here's my current resume:
+"""
+        middle = "\n\nHere's the job description:\n"
+        suffix = "\n\nPlease provide the customized resume in LaTeX format:"
+        return prefix, middle, suffix
+
+    def _atomic_write(self, path: Path, writer_fn):
+        """Write a config file atomically with a large write buffer.
+
+        The content goes to a temp file first (128 KiB buffer to cut
+        syscall count), is fsynced, then renamed over the target so a
+        crash mid-write can never leave a half-written config behind.
+        """
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', buffering=131072, encoding='utf-8') as f:
+            writer_fn(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _create_default_config(self):
+        """Create default configuration if file doesn't exist."""
+        self.config.read_string(_DEFAULT_CONFIG_INI)
+        self._atomic_write(self.config_file, lambda f: f.write(_DEFAULT_CONFIG_INI))
+
+    def _migrate_legacy_prompts(self):
+        """Fold a legacy prompts.ini into config.ini as prompt.* sections."""
+        legacy = configparser.RawConfigParser()
+        try:
+            with open(self.prompts_file, 'r', buffering=65536, encoding='utf-8') as f:
+                legacy.read_file(f)
+        except FileNotFoundError:
+            legacy.read_string(_DEFAULT_PROMPT_SECTIONS_INI.replace('[prompt.', '['))
+
+        for section in legacy.sections():
+            target = f'prompt.{section}'
+            if not self.config.has_section(target):
+                self.config.add_section(target)
+            for key, value in legacy.items(section):
+                self.config.set(target, key, value)
+
+        self._atomic_write(self.config_file, self.config.write)
     
     def get_ai_model(self) -> str:
         """Get the AI model to use."""
-        return self.config.get('ai', 'model', fallback='gemini-1.5-flash')
-    
+        return self._ai_model
+
     def get_templates_dir(self) -> Path:
         """Get the templates directory path."""
-        return self.config_dir / self.config.get('paths', 'templates_dir', fallback='templates')
-    
+        return self._templates_dir
+
     def get_output_dir(self) -> Path:
         """Get the output directory path."""
-        return self.config_dir / self.config.get('paths', 'output_dir', fallback='output')
-    
+        return self._output_dir
+
     def get_job_descriptions_dir(self) -> Path:
         """Get the job descriptions directory path."""
-        return self.config_dir / self.config.get('paths', 'job_descriptions_dir', fallback='job_descriptions')
-    
+        return self._job_descriptions_dir
+
     def get_resume_template_name(self) -> str:
         """Get the resume template filename."""
-        return self.config.get('files', 'resume_template', fallback='resume.tex')
-    
+        return self._resume_template
+
     def get_resume_class_name(self) -> str:
         """Get the resume class filename."""
-        return self.config.get('files', 'resume_class', fallback='resume.cls')
-    
+        return self._resume_class
+
     def get_max_job_title_length(self) -> int:
         """Get maximum job title length for filenames."""
-        return self.config.getint('output', 'max_job_title_length', fallback=50)
-    
+        return self._max_job_title_length
+
     def should_include_timestamp(self) -> bool:
         """Check if timestamp should be included in filenames."""
-        return self.config.getboolean('output', 'include_timestamp', fallback=True)
-    
+        return self._include_timestamp
+
     def should_cleanup_aux_files(self) -> bool:
         """Check if auxiliary files should be cleaned up."""
-        return self.config.getboolean('output', 'cleanup_aux_files', fallback=True)
-    
+        return self._cleanup_aux_files
+
+    def get_response_cache_size(self) -> int:
+        """Get the maximum number of cached Gemini responses."""
+        return self._response_cache_size
+
+    def get_response_cache_ttl_days(self) -> int:
+        """Get how many days a cached Gemini response stays valid."""
+        return self._response_cache_ttl_days
+
+    def get_pdf_cache_dir(self) -> Path:
+        """Get the directory for the content-addressed PDF cache."""
+        return self._pdf_cache_dir
+
+    def get_pdf_cache_size(self) -> int:
+        """Get the maximum number of PDFs kept in the cache."""
+        return self._pdf_cache_size
+
     def get_latex_compiler(self) -> str:
         """Get LaTeX compiler command."""
-        return self.config.get('latex', 'compiler', fallback='pdflatex')
-    
+        return self._latex_compiler
+
     def get_compilation_passes(self) -> int:
         """Get number of LaTeX compilation passes."""
-        return self.config.getint('latex', 'compilation_passes', fallback=2)
-    
-    def get_compiler_options(self) -> List[str]:
-        """Get LaTeX compiler options as a list."""
-        options = self.config.get('latex', 'compiler_options', fallback='-interaction=nonstopmode')
-        return [opt.strip() for opt in options.split() if opt.strip()]
-    
-    def get_aux_extensions(self) -> List[str]:
-        """Get list of auxiliary file extensions to clean up."""
-        extensions = self.config.get('latex', 'aux_extensions', fallback='.aux,.log,.out')
-        return [ext.strip() for ext in extensions.split(',') if ext.strip()]
-    
-    def get_focus_areas(self) -> List[str]:
-        """Get list of focus areas for customization."""
-        areas = self.config.get('customization', 'focus_areas', fallback='skills,experience,summary')
-        return [area.strip() for area in areas.split(',') if area.strip()]
-    
+        return self._compilation_passes
+
+    def get_compiler_options(self) -> Tuple[str, ...]:
+        """Get LaTeX compiler options as a pre-split tuple."""
+        return self._compiler_options
+
+    def should_use_draftmode_first_pass(self) -> bool:
+        """Check if multi-pass compiles should skip PDF output on pass one."""
+        return self._draftmode_first_pass
+
+    def get_compile_timeout(self) -> int:
+        """Get the per-pass LaTeX compilation timeout in seconds."""
+        return self._compile_timeout
+
+    def get_aux_extensions(self) -> Tuple[str, ...]:
+        """Get auxiliary file extensions to clean up as a pre-split tuple."""
+        return self._aux_extensions
+
+    def get_focus_areas(self) -> Tuple[str, ...]:
+        """Get focus areas for customization as a pre-split tuple."""
+        return self._focus_areas
+
     def should_add_explanations(self) -> bool:
         """Check if explanatory comments should be added."""
-        return self.config.getboolean('customization', 'add_explanations', fallback=False)
-    
+        return self._add_explanations
+
     def should_preserve_formatting(self) -> bool:
         """Check if original formatting should be strictly preserved."""
-        return self.config.getboolean('customization', 'preserve_formatting', fallback=True)
-    
+        return self._preserve_formatting
+
     def get_max_retries(self) -> int:
         """Get maximum number of retry attempts for AI calls."""
-        return self.config.getint('customization', 'max_retries', fallback=3)
+        return self._max_retries
     
     def build_ai_prompt(self, resume_content: str, job_description: str) -> str:
-        """Build the complete AI prompt from configuration."""
-        # Get prompt components
-        role = self.prompts.get('system', 'role', fallback='You are an expert resume writer.')
-        context = self.prompts.get('instructions', 'context', fallback='Customize the resume for the job.')
-        focus_areas = self.prompts.get('customization', 'focus_areas', fallback='skills, experience')
-        format_req = self.prompts.get('output', 'format_requirements', fallback='Return only LaTeX code.')
-        quality = self.prompts.get('output', 'quality_guidelines', fallback='Ensure proper LaTeX syntax.')
-        approach = self.prompts.get('style', 'approach', fallback='Maintain professional tone.')
-        
-        # Build the complete prompt
-        prompt = f"""{role}
-
-{context}
+        """Build the complete AI prompt from the precompiled template.
 
-Focus on: {focus_areas}
-
-IMPORTANT REQUIREMENTS:
-- {format_req}
-- {quality}
-- {approach}
-
-OUTPUT FORMAT:
-Please return ONLY the complete customized LaTeX resume content. Do not include any explanations, markdown formatting, or additional text outside the LaTeX code.
-
-Here's my current resume:
-{resume_content}
-
-Here's the job description:
-{job_description}
-
-Please provide the customized resume in LaTeX format:"""
-        
+        Results are memoized per input pair so retry loops and batch runs
+        with a constant resume don't rebuild the multi-KB prompt string.
+        """
+        key = (resume_content, job_description)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            if len(self._prompt_cache) >= 32:
+                self._prompt_cache.clear()
+            prefix, middle, suffix = self._prompt_parts
+            prompt = ''.join((prefix, resume_content, middle, job_description, suffix))
+            self._prompt_cache[key] = prompt
         return prompt
     
+    @contextmanager
+    def deferred_writes(self):
+        """Batch several updates into a single write.
+
+        Inside the block, update_config/update_prompt only mutate the
+        in-memory parser; the file (and derived caches) are written once
+        on exit instead of once per update.
+        """
+        self._defer_writes = True
+        try:
+            yield self
+        finally:
+            self._defer_writes = False
+            if self._dirty_config:
+                self._dirty_config = False
+                self._atomic_write(self.config_file, self.config.write)
+            self._write_cache()
+            self._materialize()
+
     def update_config(self, section: str, key: str, value: str):
         """Update a configuration value."""
         if not self.config.has_section(section):
             self.config.add_section(section)
-        
+
         self.config.set(section, key, value)
-        
+
+        if self._defer_writes:
+            self._dirty_config = True
+            return
+
         # Save to file
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
-    
+        self._atomic_write(self.config_file, self.config.write)
+
+        # Refresh cached attributes and the JSON cache
+        self._write_cache()
+        self._materialize()
+
     def update_prompt(self, section: str, key: str, value: str):
-        """Update a prompt configuration value."""
-        if not self.prompts.has_section(section):
-            self.prompts.add_section(section)
-        
-        self.prompts.set(section, key, value)
-        
-        # Save to file
-        with open(self.prompts_file, 'w') as f:
-            self.prompts.write(f)
-    
+        """Update a prompt configuration value.
+
+        Prompt settings live in config.ini under namespaced prompt.*
+        sections, so this is update_config with the prefix applied.
+        """
+        self.update_config(f'prompt.{section}', key, value)
+
+    def _config_mtime_ns(self) -> int:
+        """Get the modification time (ns) of the config file, 0 if missing."""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def reload_if_changed(self) -> bool:
+        """Reload configuration if the file changed on disk.
+
+        Returns True if a reload happened. Useful for long-running callers
+        that want to pick up external edits without re-parsing every time.
+        """
+        if self._config_mtime_ns() != getattr(self, '_loaded_mtime', None):
+            self.load_configurations()
+            return True
+        return False
+
     def get_config_summary(self) -> Dict[str, Any]:
-        """Get a summary of current configuration."""
-        return {
-            'ai_model': self.get_ai_model(),
-            'templates_dir': str(self.get_templates_dir()),
-            'output_dir': str(self.get_output_dir()),
-            'latex_compiler': self.get_latex_compiler(),
-            'compilation_passes': self.get_compilation_passes(),
-            'focus_areas': self.get_focus_areas(),
-            'max_retries': self.get_max_retries(),
-            'include_timestamp': self.should_include_timestamp(),
-            'cleanup_aux_files': self.should_cleanup_aux_files(),
-            'preserve_formatting': self.should_preserve_formatting(),
-            'add_explanations': self.should_add_explanations()
-        }
+        """Get a summary of current configuration.
+
+        The dict is built once per load in _materialize(); treat it as
+        read-only.
+        """
+        return self._summary
+
+
+# Cached ConfigManager instances keyed by config directory, stored with the
+# mtime of the file they were parsed from so stale entries are rebuilt.
+_config_cache: Dict[Path, ConfigManager] = {}
 
 
 # Convenience function for getting default config manager
-def get_config() -> ConfigManager:
-    """Get the default configuration manager instance."""
-    return ConfigManager()
+def get_config(config_dir: Path = None) -> ConfigManager:
+    """Get the configuration manager instance for a directory.
+
+    Instances are memoized per config directory; a cheap stat of the
+    config file decides whether the cached instance is still current,
+    so repeated calls avoid re-reading and re-parsing unchanged files.
+    """
+    if config_dir is None:
+        config_dir = Path(__file__).parent
+
+    cached = _config_cache.get(config_dir)
+    if cached is not None and cached._config_mtime_ns() == cached._loaded_mtime:
+        return cached
+
+    instance = ConfigManager(config_dir)
+    _config_cache[config_dir] = instance
+    return instance
 
 
 if __name__ == "__main__":
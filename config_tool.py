@@ -5,11 +5,16 @@ Configuration Utility for Resume Customizer Tool
 This utility helps manage configuration settings and prompts.
 """
 
-import argparse
+from __future__ import annotations
+
+import os
 import sys
 from pathlib import Path
 
-from config_manager import ConfigManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from config_manager import ConfigManager
 
 
 def show_config(config: ConfigManager):
@@ -59,6 +64,29 @@ def set_config_value(config: ConfigManager, setting: str, value: str):
         return False
 
 
+def set_config_values(config: ConfigManager, assignments):
+    """Set several configuration values with a single file write."""
+    parsed = []
+    for assignment in assignments:
+        setting, sep, value = assignment.partition('=')
+        setting_parts = setting.split('.')
+        if not sep or len(setting_parts) != 2:
+            print(f"❌ Error: Assignment must be in format 'section.key=value': {assignment}")
+            return False
+        parsed.append((setting_parts[0], setting_parts[1], value))
+
+    try:
+        with config.deferred_writes():
+            for section, key, value in parsed:
+                config.update_config(section, key, value)
+        for section, key, value in parsed:
+            print(f"✅ Updated {section}.{key} = {value}")
+        return True
+    except Exception as e:
+        print(f"❌ Error updating configuration: {e}")
+        return False
+
+
 def show_prompt_template(config: ConfigManager):
     """Show the current prompt template."""
     print("📝 Current AI Prompt Template")
@@ -112,29 +140,43 @@ def reset_config(config: ConfigManager):
         print("❌ Reset cancelled")
 
 
+# shutil.which results keyed by (command, PATH); PATH rarely changes
+# within a process, so repeat validations skip the directory walk
+_which_cache = {}
+
+
+def _cached_which(command: str):
+    """Look up a command on PATH, caching the result per PATH value."""
+    key = (command, os.environ.get('PATH'))
+    if key not in _which_cache:
+        import shutil
+        _which_cache[key] = shutil.which(command)
+    return _which_cache[key]
+
+
 def validate_config(config: ConfigManager):
     """Validate current configuration."""
     print("🔍 Validating Configuration")
     print("-" * 30)
-    
+
     issues = []
-    
-    # Check if directories exist
+
+    # Check templates directory and resume template with one directory
+    # scan instead of a stat call per path
     templates_dir = config.get_templates_dir()
-    output_dir = config.get_output_dir()
-    
-    if not templates_dir.exists():
+    try:
+        with os.scandir(templates_dir) as entries:
+            template_names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         issues.append(f"Templates directory not found: {templates_dir}")
-    
-    # Check for resume template
-    resume_template = templates_dir / config.get_resume_template_name()
-    if not resume_template.exists():
-        issues.append(f"Resume template not found: {resume_template}")
-    
+    else:
+        if config.get_resume_template_name() not in template_names:
+            resume_template = templates_dir / config.get_resume_template_name()
+            issues.append(f"Resume template not found: {resume_template}")
+
     # Check LaTeX compiler
-    import shutil
     compiler = config.get_latex_compiler()
-    if not shutil.which(compiler):
+    if not _cached_which(compiler):
         issues.append(f"LaTeX compiler not found: {compiler}")
     
     # Report results
@@ -149,6 +191,10 @@ def validate_config(config: ConfigManager):
 
 
 def main():
+    # Imported here so `--help` and commands that don't touch the config
+    # avoid paying for argparse/configparser at module load
+    import argparse
+
     parser = argparse.ArgumentParser(description="Manage Resume Customizer configuration")
     parser.add_argument('--config-dir', '-d', help="Configuration directory")
     
@@ -162,6 +208,10 @@ def main():
     set_parser.add_argument('setting', help='Setting in format section.key')
     set_parser.add_argument('value', help='Value to set')
     
+    # Set multiple configuration values in one write
+    set_many_parser = subparsers.add_parser('set-many', help='Set multiple configuration values in a single write')
+    set_many_parser.add_argument('assignments', nargs='+', help='Assignments in format section.key=value')
+
     # Show prompt template
     subparsers.add_parser('prompt', help='Show current prompt template')
     
@@ -185,8 +235,15 @@ def main():
     if not args.command:
         parser.print_help()
         return
-    
+
+    if args.command == 'models':
+        # Needs no configuration at all
+        list_models()
+        return
+
     # Initialize configuration
+    from config_manager import ConfigManager
+
     config_dir = Path(args.config_dir) if args.config_dir else None
     config = ConfigManager(config_dir)
     
@@ -195,12 +252,12 @@ def main():
         show_config(config)
     elif args.command == 'set':
         set_config_value(config, args.setting, args.value)
+    elif args.command == 'set-many':
+        set_config_values(config, args.assignments)
     elif args.command == 'prompt':
         show_prompt_template(config)
     elif args.command == 'edit-prompt':
         edit_prompt_section(config, args.section, args.key, args.value)
-    elif args.command == 'models':
-        list_models()
     elif args.command == 'reset':
         reset_config(config)
     elif args.command == 'validate':
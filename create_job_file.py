@@ -4,8 +4,11 @@ Simple script to create a job description file interactively.
 """
 
 import os
+import sys
 from pathlib import Path
 
+from filename_utils import sanitize_title
+
 def create_job_description_file():
     """Interactive script to create job description files."""
     print("📝 Job Description File Creator")
@@ -18,23 +21,15 @@ def create_job_description_file():
         return
     
     # Clean filename
-    clean_title = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-    filename = clean_title.replace(' ', '_').lower() + '.txt'
+    filename = sanitize_title(job_title) + '.txt'
     
     # Get job description
     print(f"\nEnter the job description (press Ctrl+D when finished):")
     print("-" * 50)
-    
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    
-    job_description = '\n'.join(lines).strip()
-    
+
+    # Read everything in one go instead of line-by-line via input()
+    job_description = sys.stdin.read().strip()
+
     if not job_description:
         print("❌ Job description cannot be empty!")
         return
@@ -45,7 +40,7 @@ def create_job_description_file():
     
     file_path = job_descriptions_dir / filename
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with open(file_path, 'w', buffering=131072, encoding='utf-8') as f:
         f.write(job_description)
     
     print(f"\n✅ Job description saved to: {file_path}")
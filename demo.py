@@ -10,8 +10,6 @@ from pathlib import Path
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from resume_customizer import ResumeCustomizer
-
 def demo():
     """Demo the resume customizer with your job description."""
     print("🎯 Resume Customizer Demo")
@@ -24,6 +22,10 @@ def demo():
         return False
     
     try:
+        # Import lazily so a missing API key fails fast without paying
+        # the Gemini SDK import cost
+        from resume_customizer import ResumeCustomizer
+
         # Initialize customizer
         print("🤖 Initializing Gemini AI...")
         customizer = ResumeCustomizer(api_key)
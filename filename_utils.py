@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Shared filename sanitization helpers for the Resume Customizer Tool.
+"""
+
+import re
+
+# Deletion table built once at import: strips every ASCII character that
+# isn't alphanumeric, space, hyphen or underscore in one C-level pass
+_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in ' -_')))
+
+# Same character class for non-ASCII input: \w covers unicode
+# alphanumerics plus underscore, so this matches exactly what the
+# deletion table removes
+_UNSAFE_RE = re.compile(r'[^\w -]+')
+
+
+def clean_title(title: str) -> str:
+    """Strip characters that are unsafe in filenames.
+
+    Keeps alphanumerics, spaces, hyphens and underscores. ASCII input
+    (the common case) goes through a single str.translate pass; anything
+    else is scrubbed with a precompiled regex — both run in C with no
+    per-character Python loop.
+    """
+    if title.isascii():
+        return title.translate(_DELETE_TABLE).strip()
+    return _UNSAFE_RE.sub('', title).strip()
+
+
+def sanitize_title(title: str) -> str:
+    """Convert a job title into a lowercase underscore-separated filename stem."""
+    return clean_title(title).replace(' ', '_').lower()
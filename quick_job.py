@@ -4,8 +4,11 @@ Quick Job Description File Creator
 """
 
 import os
+import sys
 from pathlib import Path
 
+from filename_utils import sanitize_title
+
 def main():
     print("📝 Quick Job Description Creator")
     print("=" * 35)
@@ -17,22 +20,13 @@ def main():
         return
     
     # Create filename
-    clean_title = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-    filename = clean_title.replace(' ', '_').lower() + '.txt'
+    filename = sanitize_title(job_title) + '.txt'
     
     print(f"\n📋 Paste the job description below (Ctrl+D when done):")
     print("-" * 50)
     
-    # Read job description
-    content_lines = []
-    try:
-        while True:
-            line = input()
-            content_lines.append(line)
-    except EOFError:
-        pass
-    
-    content = '\n'.join(content_lines).strip()
+    # Read everything in one go instead of line-by-line via input()
+    content = sys.stdin.read().strip()
     if not content:
         print("❌ Job description cannot be empty!")
         return
@@ -42,7 +36,7 @@ def main():
     job_dir.mkdir(exist_ok=True)
     
     file_path = job_dir / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with open(file_path, 'w', buffering=131072, encoding='utf-8') as f:
         f.write(content)
     
     print(f"\n✅ Saved: {file_path}")
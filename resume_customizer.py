@@ -11,21 +11,47 @@ Usage:
     python resume_customizer.py --job-file path/to/job_description.txt
 """
 
+import hashlib
 import os
+import re
 import sys
 import argparse
 import subprocess
-import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import google.generativeai as genai
 from typing import Optional, Tuple
 
 from config_manager import ConfigManager
+from filename_utils import clean_title
+
+# LaTeX constructs that need a second pass to resolve; a resume without
+# any of them compiles correctly in a single pass
+_MULTIPASS_RE = re.compile(r'\\(?:ref|cite|label|tableofcontents|listoffigures|bibliography)\b')
+
+
+def _strip_code_fences(text: str) -> str:
+    """Remove a leading/trailing markdown code fence, if present.
+
+    Operates once on the assembled text: a constant-cost check at each
+    end instead of rescanning the body.
+    """
+    if text.startswith('```'):
+        first_newline = text.find('\n')
+        if first_newline != -1:
+            text = text[first_newline + 1:]
+    if text.endswith('```'):
+        text = text[:-3].rstrip()
+    return text
 
 
 class ResumeCustomizer:
     def __init__(self, api_key: str, config: ConfigManager = None):
         """Initialize the Resume Customizer with Gemini API key and configuration."""
+        # Imported here rather than at module scope: the SDK costs
+        # ~150ms to import, which --help/--show-config never need
+        import google.generativeai as genai
+
         genai.configure(api_key=api_key)
         
         # Use provided config or create default
@@ -41,42 +67,59 @@ class ResumeCustomizer:
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(exist_ok=True)
-    
-    def read_resume_template(self) -> str:
-        """Read the original resume.tex file."""
-        # Try configured paths
+
+        # Candidate locations (configured name first, then fallback),
+        # built once; the resolved paths are cached on first use
         resume_filename = self.config.get_resume_template_name()
-        resume_paths = [
+        cls_filename = self.config.get_resume_class_name()
+        self._resume_candidates = (
             self.templates_dir / resume_filename,
             self.base_dir / resume_filename,
             self.templates_dir / "resume.tex",  # fallback
             self.base_dir / "resume.tex"        # fallback
-        ]
-        
-        for resume_path in resume_paths:
-            if resume_path.exists():
-                with open(resume_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-        
-        raise FileNotFoundError(f"Resume template not found in {[str(p) for p in resume_paths]}")
-    
-    def get_cls_file_path(self) -> Path:
-        """Get the path to the resume.cls file."""
-        # Try configured paths
-        cls_filename = self.config.get_resume_class_name()
-        cls_paths = [
+        )
+        self._cls_candidates = (
             self.templates_dir / cls_filename,
             self.base_dir / cls_filename,
             self.templates_dir / "resume.cls",  # fallback
             self.base_dir / "resume.cls"        # fallback
-        ]
-        
-        for cls_path in cls_paths:
-            if cls_path.exists():
-                return cls_path
-        
-        raise FileNotFoundError(f"Resume class file not found in {[str(p) for p in cls_paths]}")
-    
+        )
+        self._resume_path = None
+        self._cls_path = None
+        self._resume_content = None
+        self._resume_content_mtime = None
+        self._fmt_ready_digest = None
+
+    def get_resume_template_path(self) -> Path:
+        """Get the path to the resume.tex template, resolving it once."""
+        if self._resume_path is None:
+            self._resume_path = next((p for p in self._resume_candidates if p.exists()), None)
+            if self._resume_path is None:
+                raise FileNotFoundError(f"Resume template not found in {[str(p) for p in self._resume_candidates]}")
+        return self._resume_path
+
+    def read_resume_template(self) -> str:
+        """Read the original resume.tex file.
+
+        The content is cached on the instance and re-read only when the
+        file's mtime changes, so batch runs read the template once.
+        """
+        resume_path = self.get_resume_template_path()
+        mtime = resume_path.stat().st_mtime_ns
+        if self._resume_content is None or mtime != self._resume_content_mtime:
+            with open(resume_path, 'r', encoding='utf-8') as file:
+                self._resume_content = file.read()
+            self._resume_content_mtime = mtime
+        return self._resume_content
+
+    def get_cls_file_path(self) -> Path:
+        """Get the path to the resume.cls file, resolving it once."""
+        if self._cls_path is None:
+            self._cls_path = next((p for p in self._cls_candidates if p.exists()), None)
+            if self._cls_path is None:
+                raise FileNotFoundError(f"Resume class file not found in {[str(p) for p in self._cls_candidates]}")
+        return self._cls_path
+
     def read_job_description(self, job_input: str, is_file: bool = False) -> str:
         """Read job description from text or file."""
         if is_file:
@@ -93,26 +136,31 @@ class ResumeCustomizer:
         """Send resume and job description to Gemini for customization."""
         # Build prompt using configuration
         prompt = self.config.build_ai_prompt(resume_content, job_description)
-        
+
+        # Identical inputs (resume, JD, model, prompt template) produce
+        # the same answer; serve it from the on-disk cache for free
+        cache_path = self._gemini_cache_path(prompt)
+        cached = self._read_cached_response(cache_path)
+        if cached is not None:
+            print("⚡ Reusing cached Gemini response for identical inputs")
+            return cached
+
         max_retries = self.config.get_max_retries()
-        
+
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(prompt)
-                result = response.text.strip()
-                
-                # Remove any code block markers if present
-                if result.startswith('```'):
-                    # Find the end of the opening code block marker
-                    first_newline = result.find('\n')
-                    if first_newline != -1:
-                        result = result[first_newline + 1:]
-                
-                if result.endswith('```'):
-                    result = result[:-3].rstrip()
-                
+                # Stream the response so tokens are consumed as they
+                # arrive instead of blocking on the full payload
+                response = self.model.generate_content(prompt, stream=True)
+                parts = []
+                for chunk in response:
+                    if chunk.text:
+                        parts.append(chunk.text)
+
+                result = _strip_code_fences(''.join(parts).strip())
+                self._store_cached_response(cache_path, result)
                 return result
-                
+
             except Exception as e:
                 if attempt < max_retries - 1:
                     print(f"⚠️  Attempt {attempt + 1} failed, retrying... ({str(e)})")
@@ -120,6 +168,91 @@ class ResumeCustomizer:
                 else:
                     raise Exception(f"Error communicating with Gemini after {max_retries} attempts: {str(e)}")
     
+    def customize_batch(self, resume_content: str, job_descriptions: list) -> list:
+        """Customize the resume for several job descriptions at once.
+
+        The calls are independent, so they run concurrently on a small
+        thread pool; results come back in input order. Cached responses
+        are still honoured per job description.
+        """
+        if not job_descriptions:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(4, len(job_descriptions))) as pool:
+            futures = [
+                pool.submit(self.customize_resume_with_gemini, resume_content, jd)
+                for jd in job_descriptions
+            ]
+            return [f.result() for f in futures]
+
+    def process_resume_batch(self, job_files: list) -> list:
+        """Customize and compile the resume for a batch of job files.
+
+        Returns a list of (tex_path, pdf_path) tuples in input order.
+        """
+        print("📄 Reading resume template...")
+        resume_content = self.read_resume_template()
+
+        job_descriptions = [self.read_job_description(p, is_file=True) for p in job_files]
+        print(f"💼 Read {len(job_descriptions)} job descriptions")
+
+        print(f"🤖 Customizing resume with {self.config.get_ai_model()} ({len(job_files)} jobs)...")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prep = pool.submit(self._warm_compile_cache, resume_content)
+            customized = self.customize_batch(resume_content, job_descriptions)
+            prep.result()
+
+        results = []
+        for job_file, content in zip(job_files, customized):
+            job_title = Path(job_file).stem.replace('_', ' ')
+            print(f"💾 Saving and compiling for: {job_title}")
+            tex_path = self.save_customized_resume(content, job_title)
+            pdf_path = self.compile_pdf(tex_path, tex_content=content)
+            self.cleanup_latex_files(tex_path)
+            results.append((tex_path, pdf_path))
+
+        return results
+
+    def _gemini_cache_path(self, prompt: str) -> Path:
+        """Cache file for a Gemini response.
+
+        Keyed by the full prompt and model name, so resume, job
+        description, and prompt-template changes all produce new keys.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(prompt.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(self.config.get_ai_model().encode('utf-8'))
+        return (Path.home() / '.cache' / 'resume-customizer' / 'gemini'
+                / f'{digest.hexdigest()}.txt')
+
+    def _read_cached_response(self, cache_path: Path) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+            if age > self.config.get_response_cache_ttl_days() * 86400:
+                return None
+            return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def _store_cached_response(self, cache_path: Path, result: str):
+        """Write a response to the cache atomically and bound its size."""
+        try:
+            cache_dir = cache_path.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.txt.tmp')
+            tmp_path.write_text(result, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+
+            # Keep only the most recently written entries
+            entries = sorted(cache_dir.glob('*.txt'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in entries[self.config.get_response_cache_size():]:
+                stale.unlink()
+        except OSError:
+            # The cache is purely an optimization; never fail a run
+            pass
+
     def save_customized_resume(self, content: str, job_title: str = None) -> Path:
         """Save the customized resume content to a new .tex file."""
         # Generate filename based on configuration
@@ -128,68 +261,293 @@ class ResumeCustomizer:
         if job_title:
             # Clean job title for filename
             max_length = self.config.get_max_job_title_length()
-            clean_title = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-            clean_title = clean_title.replace(' ', '_')[:max_length]
-            filename_parts.append(clean_title)
+            filename_parts.append(clean_title(job_title).replace(' ', '_')[:max_length])
         else:
             filename_parts.append("customized")
         
         if self.config.should_include_timestamp():
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename_parts.append(timestamp)
         
         filename = "_".join(filename_parts) + ".tex"
         output_path = self.output_dir / filename
-        
-        with open(output_path, 'w', encoding='utf-8') as file:
+
+        # Write atomically so a killed process never leaves a partial
+        # .tex behind for the compile/cache layers to pick up
+        tmp_path = output_path.with_suffix('.tex.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as file:
             file.write(content)
-        
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, output_path)
+
         return output_path
     
-    def compile_pdf(self, tex_file_path: Path) -> Path:
-        """Compile the .tex file to PDF using pdflatex."""
-        # Copy the .cls file to output directory if it exists
-        try:
-            cls_source = self.get_cls_file_path()
-            cls_dest = self.output_dir / cls_source.name
-            import shutil
-            shutil.copy2(cls_source, cls_dest)
-        except FileNotFoundError as e:
-            print(f"⚠️  Warning: {e}")
-            print("Proceeding without class file...")
-        
-        # Change to output directory for compilation
-        original_cwd = os.getcwd()
-        os.chdir(self.output_dir)
-        
+    def compile_pdf(self, tex_file_path: Path, tex_content: str = None) -> Path:
+        """Compile the .tex file to PDF using pdflatex.
+
+        When the content has no cross-references the configured pass
+        count is reduced to one; when several passes are needed, the
+        non-final passes run with -draftmode (aux files are still
+        written but PDF shipout is skipped).
+
+        Results are cached by content: a rerun whose tex/cls/compiler
+        inputs hash to a previously compiled PDF skips pdflatex entirely.
+        """
+        import shutil
+
+        if tex_content is None:
+            tex_content = tex_file_path.read_text(encoding='utf-8')
+
+        pdf_path = tex_file_path.with_suffix('.pdf')
+
+        # Cheapest check first: a rerun with byte-identical content
+        # reuses the previous PDF without even hashing the cls file
+        content_digest = hashlib.blake2b(tex_content.encode('utf-8'), digest_size=16).hexdigest()
+        marker_path = self.output_dir / '.last_content'
+        last_pdf = self.output_dir / '.last.pdf'
         try:
-            # Get compilation settings from config
-            compiler = self.config.get_latex_compiler()
-            passes = self.config.get_compilation_passes()
-            options = self.config.get_compiler_options()
-            
-            # Run LaTeX compilation
+            if marker_path.read_text() == content_digest and last_pdf.exists():
+                print("⚡ Content unchanged since last run; reusing previous PDF")
+                shutil.copy2(last_pdf, pdf_path)
+                return pdf_path
+        except OSError:
+            pass
+
+        # Then the content-addressed PDF cache
+        cache_key = self._pdf_cache_key(tex_content)
+        cached_pdf = self.config.get_pdf_cache_dir() / f"{cache_key}.pdf"
+        if cached_pdf.exists():
+            print("⚡ Reusing cached PDF for identical content")
+            shutil.copy2(cached_pdf, pdf_path)
+            os.utime(cached_pdf)  # mark as recently used for eviction
+            self._update_last_markers(content_digest, pdf_path)
+            return pdf_path
+
+        env = self._compile_env()
+
+        # Get compilation settings from config
+        compiler = self.config.get_latex_compiler()
+        passes = self.config.get_compilation_passes()
+        options = self.config.get_compiler_options()
+
+        # A resume without cross-references compiles in one pass
+        if passes > 1 and not _MULTIPASS_RE.search(tex_content):
+            passes = 1
+
+        draftmode_first = self.config.should_use_draftmode_first_pass()
+        timeout = self.config.get_compile_timeout()
+
+        # Precompile the preamble into a format file so repeat runs
+        # skip package loading; falls back to a plain compile if the
+        # format can't be built or used
+        fmt_name = None
+        body_path = None
+        split = tex_content.find(r'\begin{document}')
+        if split != -1:
+            fmt_name = self._ensure_precompiled_format(compiler, tex_content[:split], env)
+            if fmt_name:
+                body_path = tex_file_path.with_name(tex_file_path.stem + '.body.tex')
+                body_path.write_text(tex_content[split:], encoding='utf-8')
+
+        use_fmt = fmt_name is not None
+        while True:
+            if use_fmt:
+                input_name = body_path.name
+                fmt_args = [f'-fmt={fmt_name}', f'-jobname={tex_file_path.stem}']
+            else:
+                input_name = tex_file_path.name
+                fmt_args = []
+
+            failed = None
             for i in range(passes):
                 print(f"📊 Running {compiler} (pass {i+1}/{passes})...")
-                
-                cmd = [compiler] + options + [tex_file_path.name]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
+
+                cmd = [compiler] + list(options) + fmt_args
+                if draftmode_first and i < passes - 1:
+                    # Non-final passes only need the aux files
+                    cmd.append('-draftmode')
+                cmd.append(input_name)
+                # Discard the (often 100KB+) log chatter on the happy
+                # path; the .log file on disk has it all if a pass
+                # fails. The timeout keeps malformed input (TeX waiting
+                # on its prompt) from hanging the run forever.
+                try:
+                    result = subprocess.run(cmd, cwd=self.output_dir, env=env,
+                                            stdin=subprocess.DEVNULL,
+                                            stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.PIPE, text=True,
+                                            start_new_session=True,
+                                            timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    raise Exception(
+                        f"LaTeX compilation timed out after {timeout}s on pass {i+1} "
+                        f"(command: {' '.join(cmd)})")
+
                 if result.returncode != 0:
-                    error_msg = f"LaTeX compilation failed on pass {i+1}:\n"
-                    error_msg += f"Command: {' '.join(cmd)}\n"
-                    error_msg += f"STDOUT:\n{result.stdout}\n"
-                    error_msg += f"STDERR:\n{result.stderr}"
-                    raise Exception(error_msg)
-            
-            pdf_path = tex_file_path.with_suffix('.pdf')
-            if not pdf_path.exists():
-                raise Exception("PDF file was not generated successfully")
-            
-            return pdf_path
-            
-        finally:
-            os.chdir(original_cwd)
+                    failed = (i, cmd, result)
+                    break
+
+            if failed is None:
+                break
+
+            if use_fmt:
+                # The dumped format may be incompatible with this
+                # document; retry the normal way before giving up
+                print("⚠️  Precompiled format failed, retrying full compile...")
+                use_fmt = False
+                continue
+
+            i, cmd, result = failed
+            log_path = self.output_dir / f'{tex_file_path.stem}.log'
+            try:
+                log_tail = log_path.read_text(encoding='utf-8', errors='replace')[-4000:]
+            except OSError:
+                log_tail = "(log file not found)"
+            error_msg = f"LaTeX compilation failed on pass {i+1}:\n"
+            error_msg += f"Command: {' '.join(cmd)}\n"
+            error_msg += f"Log tail ({log_path}):\n{log_tail}\n"
+            error_msg += f"STDERR:\n{result.stderr}"
+            raise Exception(error_msg)
+
+        if body_path is not None:
+            body_path.unlink(missing_ok=True)
+
+        if not pdf_path.exists():
+            raise Exception("PDF file was not generated successfully")
+
+        # Store the result in the cache for future identical runs
+        self._store_cached_pdf(cached_pdf, pdf_path)
+        self._update_last_markers(content_digest, pdf_path)
+
+        return pdf_path
+
+
+    def _update_last_markers(self, content_digest: str, pdf_path: Path):
+        """Record the latest content hash and PDF for the rerun fast path."""
+        import shutil
+
+        try:
+            shutil.copy2(pdf_path, self.output_dir / '.last.pdf')
+            (self.output_dir / '.last_content').write_text(content_digest)
+        except OSError:
+            pass
+
+    def _compile_env(self) -> dict:
+        """Environment for pdflatex runs.
+
+        TEXINPUTS lets TeX find resume.cls in the templates directory
+        without copying it into the output directory; the trailing
+        colon keeps the distribution's default search path.
+        """
+        env = os.environ.copy()
+        env['TEXINPUTS'] = f"{self.templates_dir}:{self.base_dir}:" + env.get('TEXINPUTS', '')
+        return env
+
+    def _warm_compile_cache(self, resume_content: str):
+        """Do compile-side preparation that doesn't need the AI output.
+
+        The customized resume keeps the template's preamble, so the
+        precompiled format built from the template is ready by the time
+        compile_pdf runs. Any failure here is ignored; compile_pdf
+        rebuilds whatever is missing.
+        """
+        try:
+            self.output_dir.mkdir(exist_ok=True)
+            split = resume_content.find(r'\begin{document}')
+            if split != -1:
+                self._ensure_precompiled_format(
+                    self.config.get_latex_compiler(),
+                    resume_content[:split],
+                    self._compile_env())
+        except Exception:
+            pass
+
+    def _ensure_precompiled_format(self, compiler: str, preamble: str, env: dict) -> Optional[str]:
+        """Build a precompiled format (.fmt) for the document preamble.
+
+        Loading resume.cls and its packages dominates pdflatex startup;
+        dumping them into a format once lets later runs with the same
+        preamble skip that cost. Returns the format jobname, or None if
+        the format couldn't be built. All files live in the output
+        directory, which is also used as the compiler's working
+        directory.
+
+        The format is keyed by a hash of the preamble so a changed
+        preamble triggers a rebuild.
+        """
+        fmt_name = 'resume-preamble'
+        digest = hashlib.blake2b(preamble.encode('utf-8'), digest_size=16).hexdigest()
+
+        # Within one process (batch mode), a format already verified or
+        # built for this preamble needs no re-checking on disk
+        if self._fmt_ready_digest == digest:
+            return fmt_name
+
+        fmt_path = self.output_dir / f'{fmt_name}.fmt'
+        key_path = self.output_dir / f'{fmt_name}.key'
+
+        try:
+            if fmt_path.exists() and key_path.exists() and key_path.read_text() == digest:
+                self._fmt_ready_digest = digest
+                return fmt_name
+
+            src_path = self.output_dir / f'{fmt_name}.src.tex'
+            src_path.write_text(preamble + '\n\\dump\n', encoding='utf-8')
+            result = subprocess.run(
+                [compiler, '-ini', '-interaction=batchmode', f'-jobname={fmt_name}',
+                 f'&{compiler}', src_path.name],
+                cwd=self.output_dir, env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                timeout=self.config.get_compile_timeout())
+            if result.returncode != 0 or not fmt_path.exists():
+                return None
+
+            key_path.write_text(digest)
+            self._fmt_ready_digest = digest
+            return fmt_name
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+    def _pdf_cache_key(self, tex_content: str) -> str:
+        """Hash every input that affects the compiled PDF."""
+        try:
+            cls_bytes = self.get_cls_file_path().read_bytes()
+        except FileNotFoundError:
+            cls_bytes = b''
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(tex_content.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(cls_bytes)
+        digest.update(b'\0')
+        digest.update(self.config.get_latex_compiler().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(' '.join(self.config.get_compiler_options()).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _store_cached_pdf(self, cached_pdf: Path, pdf_path: Path):
+        """Copy a compiled PDF into the cache and evict the oldest entries."""
+        import shutil
+
+        try:
+            cache_dir = cached_pdf.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Copy via a temp name so a crash can't leave a truncated
+            # PDF under a valid cache key
+            tmp_pdf = cached_pdf.with_suffix('.pdf.tmp')
+            shutil.copy2(pdf_path, tmp_pdf)
+            os.replace(tmp_pdf, cached_pdf)
+
+            # Keep only the most recently used entries
+            entries = sorted(cache_dir.glob('*.pdf'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in entries[self.config.get_pdf_cache_size():]:
+                stale.unlink()
+        except OSError:
+            # The cache is purely an optimization; never fail a compile
+            pass
     
     def cleanup_latex_files(self, tex_file_path: Path):
         """Clean up auxiliary LaTeX files (.aux, .log, etc.)."""
@@ -197,15 +555,17 @@ class ResumeCustomizer:
             print("🔧 Skipping cleanup (disabled in config)")
             return
         
+        # One directory scan instead of a stat per extension; also
+        # catches multi-part suffixes like .synctex.gz
+        prefix = tex_file_path.stem + '.'
         aux_extensions = self.config.get_aux_extensions()
         cleaned_count = 0
-        
-        for ext in aux_extensions:
-            aux_file = tex_file_path.with_suffix(ext)
-            if aux_file.exists():
-                aux_file.unlink()
+
+        for entry in os.scandir(tex_file_path.parent):
+            if entry.name.startswith(prefix) and entry.name.endswith(aux_extensions):
+                os.unlink(entry.path)
                 cleaned_count += 1
-        
+
         if cleaned_count > 0:
             print(f"🧹 Cleaned up {cleaned_count} auxiliary files")
     
@@ -220,14 +580,19 @@ class ResumeCustomizer:
         print(f"   📏 Job description: {len(job_description)} characters")
         
         print(f"🤖 Customizing resume with {self.config.get_ai_model()}...")
-        customized_content = self.customize_resume_with_gemini(resume_content, job_description)
+        # Warm the compile side (output dir, preamble format) in the
+        # background while the Gemini round-trip is in flight
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prep = pool.submit(self._warm_compile_cache, resume_content)
+            customized_content = self.customize_resume_with_gemini(resume_content, job_description)
+            prep.result()
         print(f"   📏 Customized content: {len(customized_content)} characters")
         
         print("💾 Saving customized resume...")
         tex_path = self.save_customized_resume(customized_content, job_title)
         
         print("📊 Compiling PDF...")
-        pdf_path = self.compile_pdf(tex_path)
+        pdf_path = self.compile_pdf(tex_path, tex_content=customized_content)
         
         print("🧹 Managing auxiliary files...")
         self.cleanup_latex_files(tex_path)
@@ -242,8 +607,10 @@ def main():
     job_group = parser.add_mutually_exclusive_group(required=False)
     job_group.add_argument('--job-description', '-d', 
                           help="Job description as text")
-    job_group.add_argument('--job-file', '-f', 
+    job_group.add_argument('--job-file', '-f',
                           help="Path to text file containing job description")
+    job_group.add_argument('--job-files', '-F',
+                          help="Glob pattern matching several job description files (batch mode)")
     
     # Optional parameters
     parser.add_argument('--job-title', '-t', 
@@ -277,8 +644,8 @@ def main():
             return
         
         # Check if job description is provided for customization
-        if not args.job_description and not args.job_file:
-            parser.error("Job description is required for resume customization. Use --job-description or --job-file, or --show-config to view configuration.")
+        if not args.job_description and not args.job_file and not args.job_files:
+            parser.error("Job description is required for resume customization. Use --job-description, --job-file or --job-files, or --show-config to view configuration.")
         
         # Get API key
         api_key = args.api_key or os.getenv('GEMINI_API_KEY')
@@ -296,6 +663,20 @@ def main():
         print()
         
         # Determine input type and process
+        if args.job_files:
+            import glob
+            job_files = sorted(glob.glob(args.job_files))
+            if not job_files:
+                print(f"❌ Error: No files match pattern: {args.job_files}")
+                sys.exit(1)
+
+            results = customizer.process_resume_batch(job_files)
+
+            print(f"\n✅ Customized resume for {len(results)} jobs!")
+            for tex_path, pdf_path in results:
+                print(f"📋 {pdf_path}")
+            return
+
         if args.job_file:
             tex_path, pdf_path = customizer.process_resume(
                 args.job_file, 
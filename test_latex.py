@@ -3,13 +3,44 @@
 Test mode for Resume Customizer - simulates AI response to test LaTeX compilation
 """
 
+import functools
 import os
+import re
 import sys
 import subprocess
-import datetime
+import tempfile
+import time
 from pathlib import Path
 import shutil
 
+from filename_utils import clean_title
+
+# Constructs that can require a second pdflatex pass; a resume without
+# them compiles correctly in one
+_MULTIPASS_RE = re.compile(r'\\(?:ref|cite|label|tableofcontents|listoffigures|bibliography)\b')
+
+# Messages pdflatex prints when another pass is actually needed
+_RERUN_MARKERS = (
+    "Rerun to get cross-references right",
+    "Label(s) may have changed",
+    "There were undefined references",
+)
+
+
+# The summary sentence the simulated customization extends, precompiled
+# so the edit is a single C-level pass over the content
+_SUMMARY_RE = re.compile(
+    r"(Software Engineer with 4 years of experience building scalable "
+    r"\\textbf\{Python APIs\} and backend systems within "
+    r"\\textbf\{microservice\} architectures\.)")
+
+
+@functools.lru_cache(maxsize=4)
+def _read_text_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a text file, keyed by path and mtime so edits invalidate."""
+    return Path(path_str).read_bytes().decode('utf-8')
+
+
 class TestResumeCustomizer:
     def __init__(self):
         """Initialize test mode."""
@@ -17,168 +48,328 @@ class TestResumeCustomizer:
         self.templates_dir = self.base_dir / "templates"
         self.output_dir = self.base_dir / "output"
         self.output_dir.mkdir(exist_ok=True)
-    
-    def read_resume_template(self) -> str:
-        """Read the original resume.tex file."""
-        resume_paths = [
+        # Assume the worst until simulate_customization has seen the content
+        self._needs_multipass = True
+        # Unknown until the first compile tries it
+        self._have_latexmk = None
+        # Candidate locations probed once; resolved paths cached below
+        self._resume_candidates = (
             self.templates_dir / "resume.tex",
             self.base_dir / "resume.tex"
-        ]
-        
-        for resume_path in resume_paths:
-            if resume_path.exists():
-                with open(resume_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-        
-        raise FileNotFoundError(f"Resume template not found in {resume_paths}")
-    
-    def get_cls_file_path(self) -> Path:
-        """Get the path to the resume.cls file."""
-        cls_paths = [
+        )
+        self._cls_candidates = (
             self.templates_dir / "resume.cls",
             self.base_dir / "resume.cls"
-        ]
-        
-        for cls_path in cls_paths:
-            if cls_path.exists():
-                return cls_path
-        
-        raise FileNotFoundError(f"Resume class file not found in {cls_paths}")
-    
+        )
+        self._template_path = None
+        self._cls_path = None
+        # Shared engine cache (fonts, formats) so batch workers warm it
+        # once instead of per scratch dir
+        tex_cache = self.base_dir / ".tex-cache"
+        tex_cache.mkdir(exist_ok=True)
+        self._tex_env = {**os.environ, 'TEXMFCACHE': str(tex_cache)}
+
+    def get_resume_template_path(self) -> Path:
+        """Get the path to the resume.tex template, resolving it once."""
+        if self._template_path is None:
+            self._template_path = next((p for p in self._resume_candidates if p.exists()), None)
+            if self._template_path is None:
+                raise FileNotFoundError(f"Resume template not found in {list(self._resume_candidates)}")
+
+        return self._template_path
+
+    def read_resume_template(self) -> str:
+        """Read the original resume.tex file."""
+        template_path = self.get_resume_template_path()
+        return _read_text_cached(str(template_path), template_path.stat().st_mtime_ns)
+
+    def get_cls_file_path(self) -> Path:
+        """Get the path to the resume.cls file, resolving it once."""
+        if self._cls_path is None:
+            self._cls_path = next((p for p in self._cls_candidates if p.exists()), None)
+            if self._cls_path is None:
+                raise FileNotFoundError(f"Resume class file not found in {list(self._cls_candidates)}")
+
+        return self._cls_path
+
     def read_job_description(self, job_file: str) -> str:
         """Read job description from file."""
         job_path = Path(job_file)
         if not job_path.exists():
             raise FileNotFoundError(f"Job description file not found at {job_path}")
-        
-        with open(job_path, 'r', encoding='utf-8') as file:
-            return file.read().strip()
+
+        return _read_text_cached(str(job_path), job_path.stat().st_mtime_ns).strip()
     
     def simulate_customization(self, resume_content: str, job_description: str) -> str:
         """Simulate AI customization by making small targeted changes."""
         print("🔄 Simulating AI customization...")
-        
-        # For testing, we'll make some targeted changes based on the ExxonMobil job
-        customized = resume_content
-        
-        # Update summary to mention Azure and microservices
-        if "Software Engineer with 4 years of experience" in customized:
-            customized = customized.replace(
-                "Software Engineer with 4 years of experience building scalable \\textbf{Python APIs} and backend systems within \\textbf{microservice} architectures.",
-                "Software Engineer with 4 years of experience building scalable \\textbf{Python APIs} and backend systems within \\textbf{microservice} architectures. Experienced with \\textbf{Azure} cloud technologies and \\textbf{REST APIs}."
-            )
-        
-        # Add a comment to show this is test-customized
-        customized = "% Test-customized resume for ExxonMobil Software Engineer position\n" + customized
-        
+
+        # For testing, we make one targeted change based on the
+        # ExxonMobil job: extend the summary sentence to mention Azure.
+        # The substitution and the marker-comment prepend build the
+        # result in a single scan + join instead of scan-then-replace
+        # plus a concat copy
+        customized = "".join((
+            "% Test-customized resume for ExxonMobil Software Engineer position\n",
+            _SUMMARY_RE.sub(
+                r"\1 Experienced with \\textbf{Azure} cloud technologies and \\textbf{REST APIs}.",
+                resume_content),
+        ))
+
+        # Decide the pass count once, while the content is in hand
+        self._needs_multipass = _MULTIPASS_RE.search(customized) is not None
+
         return customized
     
+    def _output_filename(self, job_title: str = None) -> str:
+        """Build the timestamped output filename for a customized resume."""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        if job_title:
+            title = clean_title(job_title).replace(' ', '_')[:50]
+            return f"resume_{title}_{timestamp}.tex"
+        return f"resume_test_{timestamp}.tex"
+
     def save_customized_resume(self, content: str, job_title: str = None) -> Path:
         """Save the customized resume content to a new .tex file."""
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if job_title:
-            clean_title = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-            clean_title = clean_title.replace(' ', '_')[:50]
-            filename = f"resume_{clean_title}_{timestamp}.tex"
-        else:
-            filename = f"resume_test_{timestamp}.tex"
-        
-        output_path = self.output_dir / filename
-        
-        with open(output_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
+        output_path = self.output_dir / self._output_filename(job_title)
+
+        # Encode once and write unbuffered: one write(2) call instead
+        # of the text-mode path interleaving encode and buffered writes
+        data = content.encode('utf-8')
+        with open(output_path, 'wb', buffering=0) as file:
+            file.write(data)
+
+        return output_path
+
+    def write_customized_resume(self, src_path: Path = None, job_title: str = None) -> Path:
+        """Stream the simulated customization from the template to disk.
+
+        Fuses read + customize + save: the marker comment goes out
+        first, then each template line passes through the summary
+        substitution on its way to the output file, so peak memory is
+        one line rather than three full copies of the resume. The
+        multipass decision is made on the same pass.
+        """
+        if src_path is None:
+            src_path = self.get_resume_template_path()
+
+        output_path = self.output_dir / self._output_filename(job_title)
+        needs_multipass = False
+
+        with open(src_path, 'r', encoding='utf-8') as src, \
+                open(output_path, 'w', encoding='utf-8', buffering=65536) as out:
+            out.write("% Test-customized resume for ExxonMobil Software Engineer position\n")
+            for line in src:
+                line = _SUMMARY_RE.sub(
+                    r"\1 Experienced with \\textbf{Azure} cloud technologies and \\textbf{REST APIs}.",
+                    line)
+                if not needs_multipass and _MULTIPASS_RE.search(line):
+                    needs_multipass = True
+                out.write(line)
+
+        self._needs_multipass = needs_multipass
         return output_path
     
-    def compile_pdf(self, tex_file_path: Path) -> Path:
-        """Compile the .tex file to PDF using pdflatex."""
-        # Copy the .cls file to output directory
-        try:
-            cls_source = self.get_cls_file_path()
-            cls_dest = self.output_dir / "resume.cls"
-            shutil.copy2(cls_source, cls_dest)
-        except FileNotFoundError as e:
-            print(f"⚠️  Warning: {e}")
-        
-        # Change to output directory for compilation
-        original_cwd = os.getcwd()
-        os.chdir(self.output_dir)
-        
+    def _run_pdflatex(self, tex_name: str, cwd: Path, draftmode: bool = False):
+        """Run one pdflatex pass in the given directory, raising on failure.
+
+        The (often 100KB+) log stream is discarded on the success path;
+        a failing pass is re-run once with capture to produce the full
+        diagnostic dump.
+        """
+        cmd = ['pdflatex', '-interaction=nonstopmode']
+        if draftmode:
+            cmd.append('-draftmode')
+        cmd.append(tex_name)
+        result = subprocess.run(cmd, cwd=cwd, env=self._tex_env,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+
+        if result.returncode != 0:
+            rerun = subprocess.run(cmd, cwd=cwd, env=self._tex_env,
+                                   capture_output=True, text=True)
+            print("LaTeX Output:")
+            print(rerun.stdout)
+            print("LaTeX Errors:")
+            print(rerun.stderr)
+            raise Exception("LaTeX compilation failed")
+
+    @staticmethod
+    def _rerun_requested(log_path: Path) -> bool:
+        """Check the pass's .log file for LaTeX's rerun markers."""
         try:
-            # Run pdflatex twice
-            for i in range(2):
-                print(f"📊 Running pdflatex (pass {i+1}/2)...")
-                result = subprocess.run([
-                    'pdflatex', 
-                    '-interaction=nonstopmode',
-                    tex_file_path.name
-                ], capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    print("LaTeX Output:")
-                    print(result.stdout)
-                    print("LaTeX Errors:")
-                    print(result.stderr)
-                    raise Exception(f"LaTeX compilation failed on pass {i+1}")
-            
-            pdf_path = tex_file_path.with_suffix('.pdf')
-            if not pdf_path.exists():
+            log_text = log_path.read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            return False
+        return any(marker in log_text for marker in _RERUN_MARKERS)
+
+    def compile_pdf(self, tex_file_path: Path, tex_content: str = None,
+                    passes_hint: int = None) -> Path:
+        """Compile the .tex file to PDF in a RAM-backed scratch dir.
+
+        All compiler output lands in a TemporaryDirectory (on /dev/shm
+        when available) and only the final PDF is moved back, so aux
+        files never hit the output directory and need no cleanup pass.
+
+        Prefers latexmk, which reads the aux state and runs pdflatex
+        the minimum number of times. Without latexmk, falls back to the
+        hand-rolled loop that runs only as many passes as the content
+        needs: a resume without cross-references gets a single pass,
+        and extra passes happen only while pdflatex itself prints a
+        rerun marker.
+        """
+        if tex_content is None:
+            tex_content = tex_file_path.read_text(encoding='utf-8')
+
+        pdf_path = tex_file_path.with_suffix('.pdf')
+        scratch_base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+        with tempfile.TemporaryDirectory(dir=scratch_base) as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / tex_file_path.name).write_text(tex_content, encoding='utf-8')
+            try:
+                # A symlink is one syscall and zero bytes copied; fall
+                # back to a hardlink, then a real copy, if the
+                # filesystem refuses
+                cls_source = self.get_cls_file_path().resolve()
+                cls_dest = tmp_path / "resume.cls"
+                try:
+                    os.symlink(cls_source, cls_dest)
+                except OSError:
+                    try:
+                        os.link(cls_source, cls_dest)
+                    except OSError:
+                        shutil.copy2(cls_source, cls_dest)
+            except FileNotFoundError as e:
+                print(f"⚠️  Warning: {e}")
+
+            # The compilers get the scratch dir via cwd=; the parent
+            # process never changes directory, so concurrent compiles
+            # from one interpreter can't trip over each other
+            if self._have_latexmk is not False:
+                try:
+                    print("📊 Running latexmk...")
+                    result = subprocess.run(
+                        ['latexmk', '-pdf', '-interaction=nonstopmode',
+                         '-halt-on-error', '-silent', tex_file_path.name],
+                        cwd=tmp_path, env=self._tex_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE, text=True)
+                    self._have_latexmk = True
+                    if result.returncode != 0:
+                        print("LaTeX Errors:")
+                        print(result.stderr)
+                        raise Exception("LaTeX compilation failed")
+                except FileNotFoundError:
+                    self._have_latexmk = False
+
+            if not self._have_latexmk:
+                if passes_hint is not None:
+                    needs_draft_pass = passes_hint > 1
+                else:
+                    needs_draft_pass = self._needs_multipass
+
+                runs = 0
+                if needs_draft_pass:
+                    # Resolve references without paying for PDF shipout
+                    runs += 1
+                    print(f"📊 Running pdflatex (pass {runs}, -draftmode)...")
+                    self._run_pdflatex(tex_file_path.name, tmp_path, draftmode=True)
+
+                # Final pass emits the PDF; repeat only while pdflatex
+                # explicitly asks for a rerun (bounded to avoid loops)
+                log_path = tmp_path / tex_file_path.with_suffix('.log').name
+                while True:
+                    runs += 1
+                    print(f"📊 Running pdflatex (pass {runs})...")
+                    self._run_pdflatex(tex_file_path.name, tmp_path)
+                    if runs >= 4 or not self._rerun_requested(log_path):
+                        break
+
+            tmp_pdf = tmp_path / pdf_path.name
+            if not tmp_pdf.exists():
                 raise Exception("PDF file was not generated")
-            
-            return pdf_path
-            
-        finally:
-            os.chdir(original_cwd)
-    
-    def cleanup_latex_files(self, tex_file_path: Path):
-        """Clean up auxiliary LaTeX files."""
-        aux_extensions = ['.aux', '.log', '.out', '.fdb_latexmk', '.fls']
-        for ext in aux_extensions:
-            aux_file = tex_file_path.with_suffix(ext)
-            if aux_file.exists():
-                aux_file.unlink()
+
+            # Only the deliverable leaves the scratch dir; the aux
+            # files vanish with it in one rmtree
+            shutil.move(str(tmp_pdf), pdf_path)
+
+        return pdf_path
     
+    def compile_one(self, resume_content: str, job_title: str, job_description: str):
+        """Customize, save and compile one variant from pre-read content.
+
+        Returns (tex_path, pdf_path). Safe to run in parallel workers:
+        each compile gets its own scratch directory.
+        """
+        customized_content = self.simulate_customization(resume_content, job_description)
+        tex_path = self.save_customized_resume(customized_content, job_title)
+        pdf_path = self.compile_pdf(tex_path, tex_content=customized_content,
+                                    passes_hint=2 if self._needs_multipass else 1)
+        return tex_path, pdf_path
+
+    @classmethod
+    def batch_compile(cls, jobs):
+        """Compile one resume variant per (job_title, job_description) pair.
+
+        pdflatex is single-threaded, so independent variants compile in
+        parallel across a process pool; results come back in input order.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        jobs = list(jobs)
+        if not jobs:
+            return []
+
+        workers = min(os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_compile_one_worker, jobs))
+
     def test_process(self) -> bool:
-        """Test the complete process."""
+        """Test the complete process.
+
+        Status messages are batched per milestone and flushed with one
+        stdout write each, instead of a write syscall per print.
+        """
         try:
-            print("📄 Reading resume template...")
-            resume_content = self.read_resume_template()
-            print(f"   Resume length: {len(resume_content)} characters")
-            
-            print("💼 Reading job description...")
+            template_path = self.get_resume_template_path()
             job_description = self.read_job_description("job_description.txt")
-            print(f"   Job description length: {len(job_description)} characters")
-            
-            print("🤖 Simulating AI customization...")
-            customized_content = self.simulate_customization(resume_content, job_description)
-            
-            print("💾 Saving test resume...")
-            tex_path = self.save_customized_resume(customized_content, "ExxonMobil_Test")
-            
+            sys.stdout.write(
+                "📄 Locating resume template...\n"
+                f"   Template size: {template_path.stat().st_size:,} bytes\n"
+                "💼 Reading job description...\n"
+                f"   Job description length: {len(job_description)} characters\n"
+                "🔄 Streaming simulated customization to disk...\n")
+
+            tex_path = self.write_customized_resume(template_path, "ExxonMobil_Test")
+
             print("📊 Compiling PDF...")
-            pdf_path = self.compile_pdf(tex_path)
-            
-            print("🧹 Cleaning up auxiliary files...")
-            self.cleanup_latex_files(tex_path)
-            
-            print(f"\n✅ Test completed successfully!")
-            print(f"📄 LaTeX file: {tex_path}")
-            print(f"📋 PDF file: {pdf_path}")
-            
-            # Show file sizes
-            tex_size = tex_path.stat().st_size
-            pdf_size = pdf_path.stat().st_size
-            print(f"\n📊 Generated files:")
-            print(f"   LaTeX: {tex_size:,} bytes")
-            print(f"   PDF: {pdf_size:,} bytes")
-            
+            pdf_path = self.compile_pdf(tex_path,
+                                        passes_hint=2 if self._needs_multipass else 1)
+
+            sys.stdout.write(
+                "\n✅ Test completed successfully!\n"
+                f"📄 LaTeX file: {tex_path}\n"
+                f"📋 PDF file: {pdf_path}\n"
+                "\n📊 Generated files:\n"
+                f"   LaTeX: {tex_path.stat().st_size:,} bytes\n"
+                f"   PDF: {pdf_path.stat().st_size:,} bytes\n")
+
             return True
-            
+
         except Exception as e:
             print(f"❌ Test failed: {e}")
             return False
 
+def _compile_one_worker(job):
+    """Process-pool entry point: each worker builds its own instance."""
+    job_title, job_description = job
+    tester = TestResumeCustomizer()
+    resume_content = tester.read_resume_template()
+    return tester.compile_one(resume_content, job_title, job_description)
+
+
 def main():
     print("🧪 Resume Customizer - Test Mode")
     print("=" * 40)
@@ -23,10 +23,18 @@ def test_setup():
     ]
     
     print("📁 Checking required files...")
+    # One directory listing per parent instead of a stat per file
+    listings = {}
     all_files_exist = True
     for file_path in files_to_check:
-        full_path = base_dir / file_path
-        if full_path.exists():
+        parent, _, name = file_path.rpartition('/')
+        parent_dir = base_dir / parent if parent else base_dir
+        if parent_dir not in listings:
+            try:
+                listings[parent_dir] = {entry.name for entry in os.scandir(parent_dir)}
+            except FileNotFoundError:
+                listings[parent_dir] = set()
+        if name in listings[parent_dir]:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} - MISSING")
@@ -42,16 +50,13 @@ def test_setup():
         print("💡 Set it with: export GEMINI_API_KEY='your_api_key_here'")
         all_files_exist = False
     
-    # Check LaTeX installation
+    # Check LaTeX installation: a PATH lookup answers the existence
+    # question without paying for a pdflatex process spawn
     print("\n📊 Checking LaTeX installation...")
-    import subprocess
-    try:
-        result = subprocess.run(['pdflatex', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ pdflatex is installed")
-        else:
-            print("❌ pdflatex not working properly")
-    except FileNotFoundError:
+    import shutil
+    if shutil.which('pdflatex'):
+        print("✅ pdflatex is installed")
+    else:
         print("❌ pdflatex is not installed")
         print("💡 Install with: sudo apt-get install texlive-latex-base texlive-latex-extra")
         all_files_exist = False